@@ -1,9 +1,22 @@
 import os
+import re
 import time
+import atexit
+import queue
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from uuid import uuid4
 from datetime import datetime
+from typing import Optional
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 
 def build_faf5_directory_path() -> str:
@@ -13,108 +26,303 @@ def build_faf5_directory_path() -> str:
     return faf5_dir
 
 
-def read_all_faf5_csvs(faf5_dir: str) -> pd.DataFrame:
+# Pipeline outputs written into the FAF5 directory; never treated as sources
+OUTPUT_FILENAMES = {
+    "FAF5_MERGED.csv",
+    "FAF5_MERGED.parquet",
+    "FAF5_MERGED_CLEANED.csv",
+    "FAF5_MERGED_CLEANED.parquet",
+    "FAF5_VALIDATION_COLUMNS.csv",
+    "FAF5_VALIDATION_ISSUES.csv",
+}
+
+
+def list_source_csvs(faf5_dir: str) -> list[tuple[str, str]]:
     """
-    Read and vertically concatenate all CSV files in the provided FAF5 directory.
+    Return sorted (file_name, file_path) pairs for the source CSVs in the FAF5 directory.
 
-    Adds a 'source_file' column to identify where each row came from.
-    Returns an empty DataFrame if no CSV files are found.
+    Uses a single `os.scandir` pass; `DirEntry.is_file` answers from the
+    directory listing itself, without a separate stat call per entry.
     """
     if not os.path.isdir(faf5_dir):
         raise FileNotFoundError(f"FAF5 directory not found: {faf5_dir}")
 
-    dataframes = []
-    excluded_filenames = {
-        "FAF5_MERGED.csv",
-        "FAF5_MERGED_CLEANED.csv",
-        "FAF5_VALIDATION_COLUMNS.csv",
-        "FAF5_VALIDATION_ISSUES.csv",
-    }
-    for file_name in sorted(os.listdir(faf5_dir)):
-        if not file_name.lower().endswith(".csv"):
-            continue
-        if file_name in excluded_filenames:
-            continue
-        file_path = os.path.join(faf5_dir, file_name)
+    with os.scandir(faf5_dir) as entries:
+        source_files = [
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".csv")
+            and entry.name not in OUTPUT_FILENAMES
+            and entry.is_file()
+        ]
+    source_files.sort()
+    return source_files
+
+
+def _arrow_types_mapper(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """Map Arrow types to pd.ArrowDtype, leaving dictionary columns to become pandas categoricals."""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _constant_dictionary_array(value: str, length: int) -> pa.DictionaryArray:
+    """Dictionary-encoded array repeating `value`; every index points at one entry."""
+    return pa.DictionaryArray.from_arrays(
+        pa.array(np.zeros(length, dtype=np.int32)), pa.array([value])
+    )
+
+
+def _read_source_csv(source: tuple[str, str]) -> pa.Table:
+    """Parse one source CSV into an Arrow table tagged with a dictionary-encoded 'source_file' column."""
+    file_name, file_path = source
+    try:
+        table = pacsv.read_csv(
+            file_path, read_options=pacsv.ReadOptions(use_threads=True)
+        )
+    except Exception as exc:
+        raise RuntimeError(f"Failed to read CSV: {file_path}") from exc
+    source_file = _constant_dictionary_array(file_name, table.num_rows)
+    return table.append_column("source_file", source_file)
+
+
+def _concat_source_tables(tables: list[pa.Table]) -> pa.Table:
+    """
+    Concatenate per-file tables, aligning columns whose inferred types differ.
+
+    Numeric widening (e.g. int64 with double) is handled by Arrow's permissive
+    promotion; columns with no common type (e.g. int64 with string) fall back
+    to text, like the Polars reader's "diagonal_relaxed" concat.
+    """
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except pa.ArrowTypeError:
+        pass
+
+    fields_by_name = {}
+    for table in tables:
+        for field in table.schema:
+            fields_by_name.setdefault(field.name, []).append(field)
+    conflicting = set()
+    for name, fields in fields_by_name.items():
         try:
-            df = pd.read_csv(file_path)
-        except Exception as exc:
-            raise RuntimeError(f"Failed to read CSV: {file_path}") from exc
-        df["source_file"] = file_name
-        dataframes.append(df)
+            pa.unify_schemas(
+                [pa.schema([field]) for field in fields], promote_options="permissive"
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            conflicting.add(name)
+    text_tables = [
+        table.cast(
+            pa.schema(
+                [
+                    field.with_type(pa.string()) if field.name in conflicting else field
+                    for field in table.schema
+                ]
+            )
+        )
+        for table in tables
+    ]
+    try:
+        return pa.concat_tables(text_tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+        raise RuntimeError(
+            f"Failed to merge CSVs with incompatible columns: {sorted(conflicting)}"
+        ) from exc
+
+
+def read_all_faf5_csvs(
+    faf5_dir: str, source_files: Optional[list[tuple[str, str]]] = None
+) -> pd.DataFrame:
+    """
+    Read and vertically concatenate all CSV files in the provided FAF5 directory.
+
+    Files are parsed concurrently with Arrow's multithreaded CSV reader (which
+    releases the GIL) and concatenated as Arrow tables in sorted file order,
+    so the result is converted to pandas only once (with Arrow-backed dtypes).
+    Adds a categorical 'source_file' column to identify where each row came from.
+    Pass `source_files` from `list_source_csvs` to reuse an existing listing.
+    Returns an empty DataFrame if no CSV files are found.
+    """
+    if source_files is None:
+        source_files = list_source_csvs(faf5_dir)
+    with ThreadPoolExecutor() as executor:
+        # map() yields results in input order, keeping the merge deterministic
+        tables = list(executor.map(_read_source_csv, source_files))
 
-    if not dataframes:
+    if not tables:
         return pd.DataFrame()
 
-    merged = pd.concat(dataframes, ignore_index=True, sort=False)
+    merged_table = _concat_source_tables(tables)
+    merged = merged_table.to_pandas(types_mapper=_arrow_types_mapper)
     return merged
 
 
-def save_merged_dataframe(df: pd.DataFrame, faf5_dir: str) -> str:
-    """Save merged DataFrame to a CSV inside FAF5 directory and return the path."""
-    output_path = os.path.join(faf5_dir, "FAF5_MERGED.csv")
-    df.to_csv(output_path, index=False)
+def read_all_faf5_csvs_lazy(
+    faf5_dir: str, source_files: Optional[list[tuple[str, str]]] = None
+) -> pl.LazyFrame:
+    """
+    Lazily scan and vertically concatenate all CSV files in the FAF5 directory.
+
+    Nothing is read until the returned LazyFrame is collected, so later
+    projections and filters are pushed down into the scans. Files with
+    differing columns are aligned diagonally (missing columns become null)
+    and a 'source_file' Enum column identifies where each row came from.
+    Column types are inferred from every row, so a late value of another
+    type (e.g. a decimal after thousands of integers) widens the column
+    instead of failing at collect time.
+    Pass `source_files` from `list_source_csvs` to reuse an existing listing.
+    Returns an empty LazyFrame if no CSV files are found.
+    """
+    if source_files is None:
+        source_files = list_source_csvs(faf5_dir)
+    source_file_dtype = pl.Enum([file_name for file_name, _ in source_files])
+    lazy_frames = [
+        pl.scan_csv(file_path, infer_schema_length=None).with_columns(
+            pl.lit(file_name, dtype=source_file_dtype).alias("source_file")
+        )
+        for file_name, file_path in source_files
+    ]
+    if not lazy_frames:
+        return pl.LazyFrame()
+    return pl.concat(lazy_frames, how="diagonal_relaxed")
+
+
+def _save_dataframe(df: pd.DataFrame, faf5_dir: str, stem: str, fmt: str) -> str:
+    """Write `df` as `<stem>.<fmt>` inside the FAF5 directory and return the path."""
+    output_path = os.path.join(faf5_dir, f"{stem}.{fmt}")
+    if fmt == "parquet":
+        df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+    elif fmt == "csv":
+        df.to_csv(output_path, index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
     return output_path
 
 
+def save_merged_dataframe(df: pd.DataFrame, faf5_dir: str, fmt: str = "parquet") -> str:
+    """Save merged DataFrame (Parquet by default, or CSV) inside FAF5 directory and return the path."""
+    return _save_dataframe(df, faf5_dir, "FAF5_MERGED", fmt)
+
+
+# Runs of characters that are not safe in a snake_case column name
+_NORM_RE = re.compile(r"[^a-z0-9]+")
+
+
 def normalize_column_name(name: str) -> str:
     """Normalize a single column name to snake_case with safe characters."""
-    normalized = name.strip().lower()
-    safe_chars = [c if c.isalnum() else "_" for c in normalized]
-    normalized = "".join(safe_chars)
-    while "__" in normalized:
-        normalized = normalized.replace("__", "_")
-    normalized = normalized.strip("_")
+    normalized = _NORM_RE.sub("_", name.strip().lower()).strip("_")
     return normalized or "column"
 
 
+def _replace_columns(df: pd.DataFrame, updates: dict) -> pd.DataFrame:
+    """
+    Return `df` with the given columns replaced, without copying the others.
+
+    Unlike `df.assign`, which deep-copies the whole frame on pandas 2.x, this
+    starts from a shallow copy so unchanged columns share memory with `df`.
+    """
+    if not updates:
+        return df
+    out = df.copy(deep=False)
+    for column_name, values in updates.items():
+        out[column_name] = values
+    return out
+
+
+def _text_to_arrow(series: pd.Series):
+    """Return the Arrow string array behind a text column, converting only when needed."""
+    if not isinstance(series.dtype, pd.ArrowDtype):
+        series = series.astype("string")
+    arr = pa.array(series)
+    if pa.types.is_dictionary(arr.type):
+        arr = arr.cast(arr.type.value_type)
+    return arr
+
+
 def strip_and_standardize_strings(df: pd.DataFrame) -> pd.DataFrame:
-    """Strip whitespace and standardize empty strings to NaN for object columns."""
-    cleaned = df.copy()
-    object_columns = cleaned.select_dtypes(include=["object"]).columns
+    """
+    Strip whitespace and standardize empty strings to NA for text columns.
+
+    Uses Arrow compute kernels; cleaned columns come back as pandas'
+    Arrow-backed "string[pyarrow]" dtype. Only the text columns are replaced;
+    the rest share memory with `df`.
+    """
+    # "string" also matches Arrow-backed text columns produced at ingest
+    object_columns = df.select_dtypes(include=["object", "string"]).columns
+    changed = {}
     for column_name in object_columns:
-        cleaned[column_name] = (
-            cleaned[column_name]
-            .astype("string")
-            .str.strip()
-            .replace({"": pd.NA})
+        arr = pc.utf8_trim_whitespace(_text_to_arrow(df[column_name]))
+        arr = pc.if_else(
+            pc.equal(pc.utf8_length(arr), 0), pa.scalar(None, arr.type), arr
         )
-    return cleaned
+        changed[column_name] = pd.array(arr, dtype="string[pyarrow]")
+    return _replace_columns(df, changed)
 
 
-def convert_mostly_numeric_columns(df: pd.DataFrame, threshold: float = 0.9) -> pd.DataFrame:
+def convert_mostly_numeric_columns(
+    df: pd.DataFrame, threshold: float = 0.9, sample_size: int = 1000
+) -> pd.DataFrame:
     """
-    Attempt to convert object columns to numeric if at least `threshold` fraction
+    Attempt to convert text columns to numeric if at least `threshold` fraction
     of non-null values can be parsed as numbers.
+
+    The decision is made on about `sample_size` non-null values spread evenly
+    over the column (or on 64 of them when the first sampled value is not
+    numeric), so every merged source file is represented, a rejected column
+    is only partially parsed and an accepted one is parsed in full exactly
+    once. Unconverted columns share memory with `df`.
     """
-    converted_df = df.copy()
-    object_columns = converted_df.select_dtypes(include=["object", "string"]).columns
+    object_columns = df.select_dtypes(include=["object", "string"]).columns
+    converted = {}
     for column_name in object_columns:
-        original_series = converted_df[column_name]
-        # Compute on non-null entries only to avoid penalizing missing data
-        non_null_mask = original_series.notna()
-        if non_null_mask.sum() == 0:
+        original_series = df[column_name]
+        if isinstance(original_series.dtype, pd.ArrowDtype):
+            # to_numeric leaves unparseable pd.ArrowDtype values as NaN, not NA
+            original_series = original_series.astype("string[pyarrow]")
+        # Sample non-null entries only to avoid penalizing missing data, and
+        # stride through them so later files are not judged by the first one
+        non_null = original_series.dropna()
+        if non_null.empty:
             continue
-        coerced = pd.to_numeric(original_series, errors="coerce")
-        convertible_ratio = coerced[non_null_mask].notna().mean()
-        if convertible_ratio >= threshold:
-            converted_df[column_name] = coerced
-    return converted_df
+        sample = non_null.iloc[:: max(1, len(non_null) // sample_size)]
+        sample = sample.head(sample_size)
+        # Text columns usually fail on their first value; confirm on a small
+        # probe before paying for the full sample
+        try:
+            float(sample.iat[0])
+        except (TypeError, ValueError):
+            probe = sample.iloc[:: max(1, len(sample) // 64)].head(64)
+            probe = pd.to_numeric(probe, errors="coerce")
+            if probe.notna().mean() < threshold:
+                continue
+        coerced_sample = pd.to_numeric(sample, errors="coerce")
+        if coerced_sample.notna().mean() < threshold:
+            continue
+        converted[column_name] = pd.to_numeric(original_series, errors="coerce")
+    return _replace_columns(df, converted)
 
 
 def drop_empty_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Drop columns that are fully empty (all NA)."""
-    return df.dropna(axis=1, how="all")
+    """Drop columns that are fully empty (all NA); returns `df` itself if there are none."""
+    has_values = df.notna().any()
+    if has_values.all():
+        return df
+    return df.loc[:, has_values]
 
 
 def remove_duplicate_rows(df: pd.DataFrame) -> pd.DataFrame:
-    """Remove exact duplicate rows."""
-    return df.drop_duplicates()
-
-
-def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply normalization to all column names in the DataFrame."""
-    rename_map = {name: normalize_column_name(name) for name in df.columns}
+    """Remove exact duplicate rows; returns `df` itself if there are none."""
+    # duplicated() factorizes each column with pandas' C hash tables and
+    # combines the codes; groupby/ngroup or row hashing measured slower.
+    duplicated = df.duplicated()
+    if not duplicated.any():
+        return df
+    return df[~duplicated]
+
+
+def build_column_rename_map(columns) -> dict:
+    """Map each column name to its normalized form, suffixing collisions with an index."""
+    rename_map = {name: normalize_column_name(name) for name in columns}
     # Resolve any collisions by suffixing with an index
     seen = {}
     for original, normalized in list(rename_map.items()):
@@ -123,7 +331,15 @@ def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
             continue
         seen[normalized] += 1
         rename_map[original] = f"{normalized}_{seen[normalized]}"
-    return df.rename(columns=rename_map)
+    return rename_map
+
+
+def normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply normalization to all column names in the DataFrame (column data is not copied)."""
+    rename_map = build_column_rename_map(df.columns)
+    out = df.copy(deep=False)
+    out.columns = [rename_map[name] for name in df.columns]
+    return out
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -134,180 +350,343 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     - Convert mostly-numeric text columns to numeric
     - Drop fully empty columns
     - Drop duplicate rows
+
+    `df` itself is not modified, but columns no step changes are shared with
+    it rather than copied; copy the result before mutating it in place if
+    `df` is still needed.
     """
-    step1 = normalize_column_names(df)
-    step2 = strip_and_standardize_strings(step1)
-    step3 = convert_mostly_numeric_columns(step2, threshold=0.9)
-    step4 = drop_empty_columns(step3)
-    step5 = remove_duplicate_rows(step4)
-    return step5
-
-
-def save_cleaned_dataframe(df: pd.DataFrame, faf5_dir: str) -> str:
-    """Save cleaned DataFrame to a CSV inside FAF5 directory and return the path."""
-    output_path = os.path.join(faf5_dir, "FAF5_MERGED_CLEANED.csv")
-    df.to_csv(output_path, index=False)
-    return output_path
+    cleaned = normalize_column_names(df)
+    cleaned = strip_and_standardize_strings(cleaned)
+    cleaned = convert_mostly_numeric_columns(cleaned, threshold=0.9)
+    cleaned = drop_empty_columns(cleaned)
+    cleaned = remove_duplicate_rows(cleaned)
+    return cleaned
 
 
-def profile_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Generate a simple profile for each column in the DataFrame."""
-    profiles = []
+def clean_lazy(lf: pl.LazyFrame, threshold: float = 0.9) -> pl.LazyFrame:
+    """
+    Polars equivalent of `clean_dataframe` expressed as a single lazy query.
+
+    String trimming, empty-string standardization and numeric conversion are
+    fused into one `with_columns` so Polars can run them in parallel without
+    intermediate copies. Deciding which columns to convert or drop needs one
+    prescan of the (trimmed) data; the returned LazyFrame is otherwise unevaluated.
+    """
+    lf = lf.rename(build_column_rename_map(lf.collect_schema().names()))
+    schema = lf.collect_schema()
+    if not schema:
+        return lf
+    text_columns = [name for name, dtype in schema.items() if dtype == pl.String]
+
+    trimmed = pl.col(text_columns).str.strip_chars()
+    lf = lf.with_columns(pl.when(trimmed.str.len_chars() > 0).then(trimmed))
+
+    # One prescan: row count, nulls per column and parseable values per text column
+    row_count_df, null_counts_df, parsed_counts_df = pl.collect_all(
+        [
+            lf.select(pl.len()),
+            lf.select(pl.all().null_count()),
+            lf.select(
+                pl.col(text_columns).cast(pl.Float64, strict=False).is_not_null().sum()
+            ),
+        ]
+    )
+    row_count = row_count_df.item()
+    null_counts = null_counts_df.row(0, named=True)
+    parsed_counts = parsed_counts_df.row(0, named=True) if text_columns else {}
+
+    numeric_columns = []
+    for column_name in text_columns:
+        non_null_count = row_count - null_counts[column_name]
+        if non_null_count == 0:
+            continue
+        if parsed_counts[column_name] / non_null_count >= threshold:
+            numeric_columns.append(column_name)
+
+    keep_columns = [
+        name for name in schema.names() if null_counts[name] < row_count
+    ]
+    return (
+        lf.with_columns(pl.col(numeric_columns).cast(pl.Float64, strict=False))
+        .select(keep_columns)
+        .unique(maintain_order=True)
+    )
+
+
+def save_cleaned_dataframe(df: pd.DataFrame, faf5_dir: str, fmt: str = "parquet") -> str:
+    """Save cleaned DataFrame (Parquet by default, or CSV) inside FAF5 directory and return the path."""
+    return _save_dataframe(df, faf5_dir, "FAF5_MERGED_CLEANED", fmt)
+
+
+@dataclass
+class ColumnStats:
+    """Reductions over one column, computed once and shared by the validation reports."""
+
+    null_count: int
+    non_null_count: int
+    num_unique: int
+    is_numeric: bool
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    std: Optional[float] = None
+
+
+def _as_float(value) -> Optional[float]:
+    """Convert a scalar reduction result to float, mapping NA to None."""
+    return None if pd.isna(value) else float(value)
+
+
+def compute_column_stats(df: pd.DataFrame) -> dict[str, ColumnStats]:
+    """
+    Compute per-column statistics for the DataFrame in a few frame-wide passes.
+
+    Null and distinct counts come from one reduction each over the whole frame
+    and numeric statistics from a single `agg` over the numeric columns.
+    """
+    total_count = int(len(df))
+    null_counts = df.isna().sum()
+    num_unique = df.nunique(dropna=True)
+    # Same meaning as is_numeric_dtype: NumPy/nullable bools count, Arrow bools
+    # (no pyarrow stddev kernel) and timedeltas do not
+    numeric_columns = [
+        column_name
+        for column_name, dtype in df.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype)
+    ]
+    numeric_df = df[numeric_columns]
+    numeric_stats = (
+        numeric_df.agg(["min", "max", "mean", "std"])
+        if not numeric_df.columns.empty
+        else pd.DataFrame()
+    )
+
+    stats = {}
     for column_name in df.columns:
-        series = df[column_name]
-        non_null_count = int(series.notna().sum())
-        null_count = int(series.isna().sum())
-        total_count = int(len(series))
-        null_pct = float(null_count / total_count) if total_count else 0.0
-        num_unique = int(series.nunique(dropna=True))
-        dtype_str = str(series.dtype)
+        null_count = int(null_counts[column_name])
+        column_stats = ColumnStats(
+            null_count=null_count,
+            non_null_count=total_count - null_count,
+            num_unique=int(num_unique[column_name]),
+            is_numeric=column_name in numeric_stats.columns,
+        )
+        if column_stats.is_numeric:
+            column_stats.min = _as_float(numeric_stats.at["min", column_name])
+            column_stats.max = _as_float(numeric_stats.at["max", column_name])
+            column_stats.mean = _as_float(numeric_stats.at["mean", column_name])
+            column_stats.std = _as_float(numeric_stats.at["std", column_name])
+        stats[column_name] = column_stats
+    return stats
+
+
+PROFILE_COLUMNS = [
+    "column_name",
+    "dtype",
+    "count",
+    "non_null_count",
+    "null_count",
+    "null_pct",
+    "num_unique",
+    "min",
+    "max",
+    "mean",
+    "std",
+    "sample_values",
+]
+
+
+def profile_columns(
+    df: pd.DataFrame, stats: Optional[dict[str, ColumnStats]] = None
+) -> pd.DataFrame:
+    """
+    Generate a simple profile for each column in the DataFrame.
 
+    Pass `stats` from `compute_column_stats` to reuse reductions already made
+    for this frame; they are computed here otherwise.
+    """
+    if stats is None:
+        stats = compute_column_stats(df)
+
+    total_count = int(len(df))
+    dtype_map = df.dtypes.astype(str).to_dict()
+    profiles = []
+    for column_name in df.columns:
+        column_stats = stats[column_name]
+        null_pct = (
+            float(column_stats.null_count / total_count) if total_count else 0.0
+        )
         profile = {
             "column_name": column_name,
-            "dtype": dtype_str,
+            "dtype": dtype_map[column_name],
             "count": total_count,
-            "non_null_count": non_null_count,
-            "null_count": null_count,
+            "non_null_count": column_stats.non_null_count,
+            "null_count": column_stats.null_count,
             "null_pct": round(null_pct, 6),
-            "num_unique": num_unique,
+            "num_unique": column_stats.num_unique,
         }
 
-        if pd.api.types.is_numeric_dtype(series):
+        if column_stats.is_numeric:
             profile.update(
                 {
-                    "min": float(series.min()) if non_null_count else None,
-                    "max": float(series.max()) if non_null_count else None,
-                    "mean": float(series.mean()) if non_null_count else None,
-                    "std": float(series.std()) if non_null_count else None,
+                    "min": column_stats.min,
+                    "max": column_stats.max,
+                    "mean": column_stats.mean,
+                    "std": column_stats.std,
                 }
             )
         else:
             sample_values = (
-                series.dropna().astype(str).unique().tolist()[:5]
+                df[column_name].dropna().astype(str).unique().tolist()[:5]
             )
             profile.update({"sample_values": ", ".join(sample_values)})
 
         profiles.append(profile)
 
-    return pd.DataFrame(profiles)
+    return pd.DataFrame(profiles, columns=PROFILE_COLUMNS)
+
+
+def _issue(issue_type: str, column: str, count: int, total: int, details: str) -> dict:
+    """Build one row of the validation issues report."""
+    return {
+        "issue_type": issue_type,
+        "column": column,
+        "count": count,
+        "pct": round(count / total, 6) if total else 0.0,
+        "details": details,
+    }
+
 
+@lru_cache(maxsize=8)
+def _allowed_source_files(faf5_dir: str, dir_mtime_ns: int) -> frozenset:
+    """Source CSV names in the FAF5 directory, cached until the directory changes."""
+    return frozenset(name for name, _ in list_source_csvs(faf5_dir))
 
-def gather_validation_issues(df: pd.DataFrame, faf5_dir: str) -> pd.DataFrame:
-    """Run a set of validation checks and return a DataFrame of issues found."""
-    issues = []
+
+def gather_validation_issues(
+    df: pd.DataFrame,
+    faf5_dir: str,
+    stats: Optional[dict[str, ColumnStats]] = None,
+    source_files: Optional[list[tuple[str, str]]] = None,
+) -> pd.DataFrame:
+    """
+    Run a set of validation checks and return a DataFrame of issues found.
+
+    Missing and negative values are counted with one frame-wide reduction
+    each rather than a scan per column. Pass `stats` from
+    `compute_column_stats` to reuse the null counts already made for this
+    frame, and `source_files` from `list_source_csvs` to reuse the listing
+    the frame was read from.
+    """
+    n = len(df)
 
     # Prepare allowed source filenames from the directory (exclude outputs)
-    try:
-        allowed_files = set(
-            name
-            for name in os.listdir(faf5_dir)
-            if name.lower().endswith(".csv")
-            and name
-            not in {
-                "FAF5_MERGED.csv",
-                "FAF5_MERGED_CLEANED.csv",
-                "FAF5_VALIDATION_COLUMNS.csv",
-                "FAF5_VALIDATION_ISSUES.csv",
-            }
-        )
-    except Exception:
-        allowed_files = set()
+    if source_files is not None:
+        allowed_files = frozenset(name for name, _ in source_files)
+    else:
+        try:
+            allowed_files = _allowed_source_files(
+                faf5_dir, os.stat(faf5_dir).st_mtime_ns
+            )
+        except Exception:
+            allowed_files = frozenset()
 
     # 1) Missing data by column
-    for column_name in df.columns:
-        null_count = int(df[column_name].isna().sum())
-        if null_count > 0:
-            issues.append(
-                {
-                    "issue_type": "missing_values",
-                    "column": column_name,
-                    "count": null_count,
-                    "pct": round(null_count / len(df), 6) if len(df) else 0.0,
-                    "details": "Column contains missing values",
-                }
-            )
+    if stats is not None:
+        null_counts = {name: column.null_count for name, column in stats.items()}
+    else:
+        null_counts = df.isna().sum().to_dict()
+    issues = [
+        _issue(
+            "missing_values",
+            column_name,
+            int(count),
+            n,
+            "Column contains missing values",
+        )
+        for column_name, count in null_counts.items()
+        if count > 0
+    ]
 
     # 2) Negative values for numeric columns
-    for column_name in df.select_dtypes(include=["number"]).columns:
-        neg_mask = df[column_name] < 0
-        neg_count = int(neg_mask.sum())
-        if neg_count > 0:
-            sample_idx = df.index[neg_mask].tolist()[:10]
-            issues.append(
-                {
-                    "issue_type": "negative_values",
-                    "column": column_name,
-                    "count": neg_count,
-                    "pct": round(neg_count / len(df), 6) if len(df) else 0.0,
-                    "details": f"Sample row indices: {sample_idx}",
-                }
+    num = df.select_dtypes(include=["number"])
+    neg_counts = num.lt(0).sum()
+    for column_name, count in neg_counts[neg_counts > 0].items():
+        # Masks only for columns that have negatives; avoids a dense matrix copy
+        neg_mask = num[column_name].lt(0).to_numpy(dtype=bool, na_value=False)
+        sample_idx = df.index[np.flatnonzero(neg_mask)[:10]].tolist()
+        issues.append(
+            _issue(
+                "negative_values",
+                column_name,
+                int(count),
+                n,
+                f"Sample row indices: {sample_idx}",
             )
+        )
 
     # 3) source_file integrity
     if "source_file" not in df.columns:
         issues.append(
-            {
-                "issue_type": "source_file_missing",
-                "column": "source_file",
-                "count": len(df),
-                "pct": 1.0 if len(df) else 0.0,
-                "details": "Column 'source_file' not found",
-            }
+            _issue(
+                "source_file_missing",
+                "source_file",
+                n,
+                n,
+                "Column 'source_file' not found",
+            )
         )
     else:
-        sf_series = df["source_file"].astype("string")
-        null_count = int(sf_series.isna().sum())
+        # Checks run on the few categories; rows are matched by integer code
+        sf = df["source_file"]
+        if not isinstance(sf.dtype, pd.CategoricalDtype):
+            sf = sf.astype("category")
+        codes = sf.cat.codes.to_numpy()
+        categories = sf.cat.categories.astype(str)
+        null_count = int((codes == -1).sum())
         if null_count > 0:
             issues.append(
-                {
-                    "issue_type": "source_file_null",
-                    "column": "source_file",
-                    "count": null_count,
-                    "pct": round(null_count / len(df), 6) if len(df) else 0.0,
-                    "details": "Null values present in 'source_file'",
-                }
+                _issue(
+                    "source_file_null",
+                    "source_file",
+                    null_count,
+                    n,
+                    "Null values present in 'source_file'",
+                )
             )
-        empty_count = int((sf_series.str.strip() == "").sum())
+        empty_codes = np.flatnonzero(categories.str.strip() == "")
+        empty_count = int(np.isin(codes, empty_codes).sum())
         if empty_count > 0:
             issues.append(
-                {
-                    "issue_type": "source_file_empty",
-                    "column": "source_file",
-                    "count": empty_count,
-                    "pct": round(empty_count / len(df), 6) if len(df) else 0.0,
-                    "details": "Empty string values present in 'source_file'",
-                }
+                _issue(
+                    "source_file_empty",
+                    "source_file",
+                    empty_count,
+                    n,
+                    "Empty string values present in 'source_file'",
+                )
             )
         if allowed_files:
-            invalid_mask = ~sf_series.isna() & ~sf_series.isin(list(allowed_files))
+            invalid_codes = np.flatnonzero(~categories.isin(list(allowed_files)))
+            invalid_mask = np.isin(codes, invalid_codes)
             invalid_count = int(invalid_mask.sum())
             if invalid_count > 0:
-                sample_vals = (
-                    sf_series[invalid_mask].unique().tolist()[:10]
-                )
+                sample_codes = pd.unique(codes[invalid_mask])[:10]
+                sample_vals = categories[sample_codes].tolist()
                 issues.append(
-                    {
-                        "issue_type": "source_file_invalid",
-                        "column": "source_file",
-                        "count": invalid_count,
-                        "pct": round(invalid_count / len(df), 6)
-                        if len(df)
-                        else 0.0,
-                        "details": f"Values not in FAF5 directory: {sample_vals}",
-                    }
+                    _issue(
+                        "source_file_invalid",
+                        "source_file",
+                        invalid_count,
+                        n,
+                        f"Values not in FAF5 directory: {sample_vals}",
+                    )
                 )
 
     # 4) Duplicate rows
     dup_count = int(df.duplicated().sum())
     if dup_count > 0:
         issues.append(
-            {
-                "issue_type": "duplicate_rows",
-                "column": "",
-                "count": dup_count,
-                "pct": round(dup_count / len(df), 6) if len(df) else 0.0,
-                "details": "Exact duplicate rows detected",
-            }
+            _issue("duplicate_rows", "", dup_count, n, "Exact duplicate rows detected")
         )
 
     return pd.DataFrame(issues)
@@ -325,34 +704,72 @@ def save_validation_issues(df_issues: pd.DataFrame, faf5_dir: str) -> str:
     return output_path
 
 
+# Background thread draining queued records into the current run's log file
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records to the file and close it; safe to call repeatedly."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+_LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s %(levelname)s run_id=%(run_id)s %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
 def configure_logger(run_id: str, project_dir: str) -> logging.LoggerAdapter:
-    """Configure console and file logging; return an adapter that injects run_id."""
+    """
+    Configure console and file logging; return an adapter that injects run_id.
+
+    Console output stays synchronous. File writes go through a queue drained
+    by a background QueueListener, so pipeline threads never block on disk.
+    """
+    global _log_listener
     logger = logging.getLogger("orbis")
     logger.setLevel(logging.INFO)
 
     # Reset handlers if re-run in same interpreter
+    _stop_log_listener()
     logger.handlers.clear()
 
     logs_dir = os.path.join(project_dir, "logs")
     os.makedirs(logs_dir, exist_ok=True)
     log_path = os.path.join(logs_dir, f"orbis_{run_id}.log")
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s run_id=%(run_id)s %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
+    stream_handler.setFormatter(_LOG_FORMATTER)
     file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_LOG_FORMATTER)
+
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _log_listener.start()
 
     logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logging.LoggerAdapter(logger, extra={"run_id": run_id})
 
 
+def _arrow_table_with_run_id(df: pd.DataFrame, run_id: str) -> pa.Table:
+    """Convert `df` to an Arrow table with a constant, dictionary-encoded run_id column."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return table.append_column(
+        "run_id", _constant_dictionary_array(run_id, table.num_rows)
+    )
+
+
 def export_to_duckdb(
     cleaned_df: pd.DataFrame,
     issues_df: pd.DataFrame,
@@ -375,16 +792,14 @@ def export_to_duckdb(
     db_path = os.path.join(project_dir, "orbis.duckdb")
     logger.info(f"Exporting to DuckDB at: {db_path}")
 
-    # Ensure run_id present
-    cleaned_with_meta = cleaned_df.copy()
-    cleaned_with_meta["run_id"] = run_id
-    issues_with_meta = issues_df.copy()
-    issues_with_meta["run_id"] = run_id
+    # Ensure run_id present; DuckDB scans the Arrow tables without another copy
+    cleaned_table = _arrow_table_with_run_id(cleaned_df, run_id)
+    issues_table = _arrow_table_with_run_id(issues_df, run_id)
 
     con = duckdb.connect(db_path)
     try:
-        con.register("cleaned_df", cleaned_with_meta)
-        con.register("issues_df", issues_with_meta)
+        con.register("cleaned_df", cleaned_table)
+        con.register("issues_df", issues_table)
 
         con.execute(
             """
@@ -421,28 +836,40 @@ def main() -> None:
 
     try:
         t0 = time.perf_counter()
-        merged_df = read_all_faf5_csvs(faf5_dir)
+        # List the sources once; ingestion and validation share it
+        source_files = list_source_csvs(faf5_dir)
+        merged_lf = read_all_faf5_csvs_lazy(faf5_dir, source_files)
+        merged_pl = merged_lf.collect(engine="streaming")
         t1 = time.perf_counter()
-        if merged_df.empty:
+        if merged_pl.is_empty():
             logger.warning("No CSV files found to merge in FAF5 directory. Exiting.")
             return
+        merged_df = merged_pl.to_arrow().to_pandas(types_mapper=_arrow_types_mapper)
         merged_output_path = save_merged_dataframe(merged_df, faf5_dir)
         logger.info(
-            f"Merged {len(merged_df)} rows from CSV files into: {merged_output_path} (elapsed={t1 - t0:.2f}s)"
+            f"Merged {len(merged_df)} rows from CSV files into Parquet: {merged_output_path} (elapsed={t1 - t0:.2f}s)"
         )
 
         t2 = time.perf_counter()
-        cleaned_df = clean_dataframe(merged_df)
+        cleaned_df = (
+            clean_lazy(merged_pl.lazy())
+            .collect(engine="streaming")
+            .to_arrow()
+            .to_pandas(types_mapper=_arrow_types_mapper)
+        )
         cleaned_output_path = save_cleaned_dataframe(cleaned_df, faf5_dir)
         t3 = time.perf_counter()
         logger.info(
-            f"Cleaned dataset has {len(cleaned_df)} rows and {cleaned_df.shape[1]} columns: {cleaned_output_path} (elapsed={t3 - t2:.2f}s)"
+            f"Cleaned dataset has {len(cleaned_df)} rows and {cleaned_df.shape[1]} columns, written to Parquet: {cleaned_output_path} (elapsed={t3 - t2:.2f}s)"
         )
 
         # Validation reports
         t4 = time.perf_counter()
-        profile_df = profile_columns(cleaned_df)
-        issues_df = gather_validation_issues(cleaned_df, faf5_dir)
+        stats = compute_column_stats(cleaned_df)
+        profile_df = profile_columns(cleaned_df, stats)
+        issues_df = gather_validation_issues(
+            cleaned_df, faf5_dir, stats, source_files
+        )
         profile_path = save_validation_profiles(profile_df, faf5_dir)
         issues_path = save_validation_issues(issues_df, faf5_dir)
         t5 = time.perf_counter()
@@ -460,14 +887,6 @@ def main() -> None:
         logger.exception("Pipeline failed with an unhandled exception")
         raise
 
-    # Validation reports
-    profile_df = profile_columns(cleaned_df)
-    issues_df = gather_validation_issues(cleaned_df, faf5_dir)
-    profile_path = save_validation_profiles(profile_df, faf5_dir)
-    issues_path = save_validation_issues(issues_df, faf5_dir)
-    print(f"Validation column profile written to: {profile_path}")
-    print(f"Validation issues written to: {issues_path}")
-
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import pandas as pd
+import polars as pl
 
 from orbis import (
     normalize_column_name,
@@ -8,6 +9,7 @@ from orbis import (
     drop_empty_columns,
     remove_duplicate_rows,
     clean_dataframe,
+    clean_lazy,
 )
 
 
@@ -36,6 +38,27 @@ def test_convert_mostly_numeric_columns():
     assert not pd.api.types.is_numeric_dtype(out["b"])  # stays object
 
 
+def test_convert_mostly_numeric_columns_decides_on_sample():
+    df = pd.DataFrame({"a": [None, "1", "x", "2", "y"]})
+    out = convert_mostly_numeric_columns(df, threshold=0.9, sample_size=2)
+    assert pd.api.types.is_numeric_dtype(out["a"])  # both sampled values parse
+    assert out["a"].isna().sum() == 3  # unparseable values coerced to NA
+
+
+def test_convert_mostly_numeric_columns_samples_whole_column():
+    # A short numeric first file must not decide for a mostly-text merge
+    df = pd.DataFrame({"a": [str(i) for i in range(200)] + ["text"] * 5000})
+    out = convert_mostly_numeric_columns(df, threshold=0.9, sample_size=100)
+    assert not pd.api.types.is_numeric_dtype(out["a"])
+    assert out["a"].iloc[-1] == "text"
+
+
+def test_convert_mostly_numeric_columns_leading_text_value():
+    df = pd.DataFrame({"a": ["n/a"] + [str(i) for i in range(20)]})
+    out = convert_mostly_numeric_columns(df, threshold=0.9)
+    assert pd.api.types.is_numeric_dtype(out["a"])  # probe looks past the first value
+
+
 def test_drop_empty_columns():
     df = pd.DataFrame({"a": [None, None], "b": [1, None]})
     out = drop_empty_columns(df)
@@ -60,3 +83,17 @@ def test_clean_dataframe_end_to_end():
     assert "empty" not in out.columns  # dropped
     assert len(out) == 2  # duplicates removed
 
+
+def test_clean_lazy_end_to_end():
+    lf = pl.LazyFrame(
+        {
+            " Total Cost ($) ": ["10 ", " 10", ""],
+            "SKU-ID": [" A ", "A", "B"],
+            "empty": [None, None, None],
+        },
+        schema_overrides={"empty": pl.String},
+    )
+    out = clean_lazy(lf).collect()
+    assert out.columns == ["total_cost", "sku_id"]  # empty dropped
+    assert out.schema["total_cost"] == pl.Float64  # mostly numeric
+    assert out["sku_id"].to_list() == ["A", "B"]  # trimmed, duplicates removed
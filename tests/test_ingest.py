@@ -0,0 +1,57 @@
+import pandas as pd
+
+from orbis import read_all_faf5_csvs, read_all_faf5_csvs_lazy, save_merged_dataframe
+
+
+def test_read_all_faf5_csvs_merges_and_tags_source(tmp_path):
+    (tmp_path / "a.csv").write_text("qty,name\n1,x\n2,y\n")
+    (tmp_path / "b.csv").write_text("qty,extra\n3,z\n")
+    (tmp_path / "FAF5_MERGED.csv").write_text("qty\n99\n")  # output, skipped
+    merged = read_all_faf5_csvs(str(tmp_path))
+    assert len(merged) == 3
+    assert set(merged.columns) == {"qty", "name", "extra", "source_file"}
+    assert isinstance(merged["source_file"].dtype, pd.CategoricalDtype)
+    assert merged["source_file"].astype(str).tolist() == ["a.csv", "a.csv", "b.csv"]
+    assert pd.isna(merged.loc[2, "name"])
+
+
+def test_read_all_faf5_csvs_empty_dir(tmp_path):
+    assert read_all_faf5_csvs(str(tmp_path)).empty
+
+
+def test_read_all_faf5_csvs_lazy_aligns_columns(tmp_path):
+    (tmp_path / "a.csv").write_text("qty,name\n1,x\n2,y\n")
+    (tmp_path / "b.csv").write_text("qty,extra\n3,z\n")
+    merged = read_all_faf5_csvs_lazy(str(tmp_path)).collect()
+    assert merged.height == 3
+    assert set(merged.columns) == {"qty", "name", "extra", "source_file"}
+    assert merged["source_file"].to_list() == ["a.csv", "a.csv", "b.csv"]
+
+
+def test_read_all_faf5_csvs_lazy_empty_dir(tmp_path):
+    assert read_all_faf5_csvs_lazy(str(tmp_path)).collect().is_empty()
+
+
+def test_save_merged_dataframe_parquet_roundtrip(tmp_path):
+    df = pd.DataFrame({"qty": [1, 2], "source_file": ["a.csv", "b.csv"]})
+    path = save_merged_dataframe(df, str(tmp_path))
+    assert path.endswith("FAF5_MERGED.parquet")
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+    assert save_merged_dataframe(df, str(tmp_path), fmt="csv").endswith(".csv")
+
+
+def test_read_all_faf5_csvs_aligns_mismatched_types(tmp_path):
+    (tmp_path / "a.csv").write_text("qty,code\n1,10\n2,20\n")
+    (tmp_path / "b.csv").write_text("qty,code\n1.5,X1\n")
+    merged = read_all_faf5_csvs(str(tmp_path))
+    assert merged["qty"].dtype.kind == "f"  # int64 + double widen
+    assert merged["qty"].tolist() == [1.0, 2.0, 1.5]
+    assert merged["code"].tolist() == ["10", "20", "X1"]  # int64 + text fall back to text
+
+
+def test_read_all_faf5_csvs_lazy_late_type_change(tmp_path):
+    rows = "\n".join(str(i) for i in range(5000))
+    (tmp_path / "a.csv").write_text(f"qty\n{rows}\n1.5\n")
+    merged = read_all_faf5_csvs_lazy(str(tmp_path)).collect()
+    assert merged.height == 5001
+    assert merged["qty"][-1] == 1.5
@@ -0,0 +1,10 @@
+import orbis
+
+
+def test_configure_logger_writes_file_through_queue(tmp_path):
+    logger = orbis.configure_logger("run1", str(tmp_path))
+    logger.info("hello")
+    orbis._stop_log_listener()  # drain the queue into the file
+    log_text = (tmp_path / "logs" / "orbis_run1.log").read_text()
+    assert "run_id=run1" in log_text
+    assert "hello" in log_text
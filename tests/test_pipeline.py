@@ -0,0 +1,84 @@
+import logging
+
+import pandas as pd
+import pytest
+
+import orbis
+
+
+def _isolate_main(tmp_path, monkeypatch):
+    """Point main() at a temporary FAF5 directory and log/export location."""
+    faf5_dir = tmp_path / "FAF5"
+    faf5_dir.mkdir()
+    configure_logger = orbis.configure_logger
+    monkeypatch.setattr(
+        orbis,
+        "configure_logger",
+        lambda run_id, project_dir: configure_logger(run_id, str(tmp_path)),
+    )
+    monkeypatch.setattr(orbis, "build_faf5_directory_path", lambda: str(faf5_dir))
+    monkeypatch.setattr(orbis, "export_to_duckdb", lambda **kwargs: None)
+    return faf5_dir
+
+
+def test_main_runs_validation_once(tmp_path, monkeypatch):
+    faf5_dir = _isolate_main(tmp_path, monkeypatch)
+    (faf5_dir / "a.csv").write_text("qty,name\n1,x\n-2,y\n")
+
+    calls = []
+    profile_columns = orbis.profile_columns
+
+    def counting_profile_columns(*args, **kwargs):
+        calls.append(1)
+        return profile_columns(*args, **kwargs)
+
+    monkeypatch.setattr(orbis, "profile_columns", counting_profile_columns)
+
+    orbis.main()
+
+    assert len(calls) == 1
+    assert (faf5_dir / "FAF5_VALIDATION_COLUMNS.csv").exists()
+    assert (faf5_dir / "FAF5_VALIDATION_ISSUES.csv").exists()
+
+
+def test_main_profiles_boolean_columns(tmp_path, monkeypatch):
+    faf5_dir = _isolate_main(tmp_path, monkeypatch)
+    (faf5_dir / "a.csv").write_text("zone,active\n1,true\n2,false\n")
+
+    orbis.main()
+
+    profile = pd.read_csv(faf5_dir / "FAF5_VALIDATION_COLUMNS.csv")
+    active = profile.set_index("column_name").loc["active"]
+    assert active["dtype"] == "bool[pyarrow]"
+    assert active["sample_values"] == "True, False"
+
+
+def test_export_to_duckdb_adds_run_id(tmp_path):
+    duckdb = pytest.importorskip("duckdb")
+    cleaned = pd.DataFrame(
+        {"qty": [1.0, 2.0], "source_file": pd.Categorical(["a.csv", "b.csv"])}
+    )
+    issues = pd.DataFrame(
+        [
+            {
+                "issue_type": "missing_values",
+                "column": "qty",
+                "count": 1,
+                "pct": 0.5,
+                "details": "",
+            }
+        ]
+    )
+    logger = logging.LoggerAdapter(logging.getLogger("orbis.test"), {"run_id": "r1"})
+    orbis.export_to_duckdb(cleaned, issues, "r1", str(tmp_path), logger)
+
+    con = duckdb.connect(str(tmp_path / "orbis.duckdb"))
+    try:
+        rows = con.execute(
+            "SELECT qty, source_file, run_id FROM orbis_cleaned ORDER BY qty"
+        ).fetchall()
+        issue_runs = con.execute("SELECT run_id FROM orbis_validation_issues").fetchall()
+    finally:
+        con.close()
+    assert rows == [(1.0, "a.csv", "r1"), (2.0, "b.csv", "r1")]
+    assert issue_runs == [("r1",)]
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from orbis import (
+    compute_column_stats,
     profile_columns,
     gather_validation_issues,
 )
@@ -13,6 +14,16 @@ def test_profile_columns_basic():
     assert len(prof) == 2
 
 
+def test_profile_columns_values():
+    df = pd.DataFrame({"a": [1, 3, None], "b": ["x", None, "y"]})
+    prof = profile_columns(df).set_index("column_name")
+    assert list(prof.index) == ["a", "b"]
+    assert prof.loc["a", "null_count"] == 1
+    assert prof.loc["a", "min"] == 1.0
+    assert prof.loc["a", "max"] == 3.0
+    assert prof.loc["b", "sample_values"] == "x, y"
+
+
 def test_gather_validation_issues():
     df = pd.DataFrame({
         "source_file": ["a.csv", None, "bad.csv"],
@@ -23,3 +34,63 @@ def test_gather_validation_issues():
     assert (issues["issue_type"] == "negative_values").any()
     assert (issues["issue_type"] == "source_file_null").any()
 
+
+def test_gather_validation_issues_negative_values_samples():
+    df = pd.DataFrame(
+        {
+            "qty": [1, -1, 2, -3],
+            "cost": pd.array([None, -2.5, 1.0, 4.0], dtype="Float64"),
+        },
+        index=[10, 11, 12, 13],
+    )
+    issues = gather_validation_issues(df, faf5_dir=".")
+    neg = issues[issues["issue_type"] == "negative_values"].set_index("column")
+    assert neg.loc["qty", "count"] == 2
+    assert neg.loc["qty", "details"] == "Sample row indices: [11, 13]"
+    assert neg.loc["cost", "details"] == "Sample row indices: [11]"
+
+
+def test_compute_column_stats_shared_by_reports():
+    df = pd.DataFrame({"source_file": ["a.csv", None], "qty": [1.0, None]})
+    stats = compute_column_stats(df)
+    assert stats["qty"].is_numeric and stats["qty"].null_count == 1
+    assert stats["qty"].min == 1.0
+    assert not stats["source_file"].is_numeric
+    prof = profile_columns(df, stats)
+    assert prof["null_count"].tolist() == [1, 1]
+    issues = gather_validation_issues(df, faf5_dir=".", stats=stats)
+    assert (issues["issue_type"] == "missing_values").sum() == 2
+
+
+def test_gather_validation_issues_source_file_empty_and_invalid(tmp_path):
+    (tmp_path / "a.csv").write_text("qty\n1\n")
+    df = pd.DataFrame({"source_file": ["a.csv", "", "  ", "bad.csv", "a.csv"]})
+    for frame in (df, df.astype("category")):
+        issues = gather_validation_issues(frame, faf5_dir=str(tmp_path))
+        by_type = issues.set_index("issue_type")
+        assert by_type.loc["source_file_empty", "count"] == 2
+        assert by_type.loc["source_file_invalid", "count"] == 3
+        assert "'bad.csv'" in by_type.loc["source_file_invalid", "details"]
+
+
+def test_profile_columns_timedelta_is_not_numeric():
+    df = pd.DataFrame({"t": pd.to_timedelta([1, -2], "s"), "a": [1, 2]})
+    stats = compute_column_stats(df)
+    assert not stats["t"].is_numeric
+    assert stats["a"].is_numeric
+    prof = profile_columns(df, stats).set_index("column_name")
+    assert pd.isna(prof.loc["t", "min"])
+    assert prof.loc["t", "sample_values"]
+
+
+def test_profile_columns_arrow_bool_is_not_numeric():
+    df = pd.DataFrame(
+        {
+            "active": pd.array([True, False, None], dtype="bool[pyarrow]"),
+            "flag": [True, False, True],
+        }
+    )
+    prof = profile_columns(df).set_index("column_name")
+    assert prof.loc["active", "sample_values"] == "True, False"
+    assert pd.isna(prof.loc["active", "std"])
+    assert prof.loc["flag", "max"] == 1.0  # NumPy bools keep numeric stats